@@ -14,16 +14,26 @@ For a comprehensive guide on the usage, examples, and additional features of the
 from __future__ import annotations
 
 import re
+import sys
 from typing import Any, Dict, Union
 from collections.abc import Mapping
 from pathlib import Path
 
 import jsonpickle
-import tomli
 import yaml
 
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
 __all__ = ["Context"]
 
+# Prefer the LibYAML (C) backed loader and dumper when PyYAML was built with it; they are drop-in replacements for
+# yaml.Loader and yaml.Dumper
+_YAML_LOADER = getattr(yaml, "CLoader", yaml.Loader)
+_YAML_DUMPER = getattr(yaml, "CDumper", yaml.Dumper)
+
 
 class Context(Mapping):
     """
@@ -188,7 +198,7 @@ class Context(Mapping):
         return cls(kwargs)
 
     @classmethod
-    def from_json(cls, json_file_or_str: Union[str, Path]) -> Context:
+    def from_json(cls, json_file_or_str: Union[str, bytes, Path]) -> Context:
         """Creates Context object from a given json file
 
         Note: jsonpickle is used to serialize/deserialize the Context object. This is done to allow for objects to be
@@ -219,8 +229,8 @@ class Context(Mapping):
 
         Parameters
         ----------
-        json_file_or_str : Union[str, Path]
-            Pathlike string or Path that points to the json file or string containing json
+        json_file_or_str : Union[str, bytes, Path]
+            Pathlike string or Path that points to the json file or string (or bytes) containing json
 
         Returns
         -------
@@ -228,8 +238,8 @@ class Context(Mapping):
         """
         json_str = json_file_or_str
 
-        # check if json_str is pathlike
-        if (json_file := Path(json_file_or_str)).exists():
+        # check if json_str is pathlike, bytes are always treated as json (no need to decode them first)
+        if not isinstance(json_file_or_str, bytes) and (json_file := Path(json_file_or_str)).exists():
             json_str = json_file.read_text(encoding="utf-8")
 
         json_dict = jsonpickle.loads(json_str)
@@ -254,7 +264,7 @@ class Context(Mapping):
         if (toml_file := Path(toml_file_or_str)).exists():
             toml_str = toml_file.read_text(encoding="utf-8")
 
-        toml_dict = tomli.loads(toml_str)
+        toml_dict = tomllib.loads(toml_str)
         return cls.from_dict(toml_dict)
 
     @classmethod
@@ -277,7 +287,7 @@ class Context(Mapping):
             yaml_str = yaml_file.read_text(encoding="utf-8")
 
         # Bandit: disable yaml.load warning
-        yaml_dict = yaml.load(yaml_str, Loader=yaml.Loader)  # nosec B506: yaml_load
+        yaml_dict = yaml.load(yaml_str, Loader=_YAML_LOADER)  # nosec B506: yaml_load
 
         return cls.from_dict(yaml_dict)
 
@@ -470,7 +480,7 @@ class Context(Mapping):
             containing all parameters of the context
         """
         # sort_keys=False to preserve order of keys
-        yaml_str = yaml.dump(self.to_dict(), sort_keys=False)
+        yaml_str = yaml.dump(self.to_dict(), Dumper=_YAML_DUMPER, sort_keys=False)
 
         # remove `!!python/object:...` from yaml
         if clean:
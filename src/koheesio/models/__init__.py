@@ -9,9 +9,10 @@ A Model class can be exceptionally handy when you need similar Pydantic models i
 Transformation and Reader classes.
 """
 
-from typing import Annotated, Any, Dict, List, Optional, Union
+from typing import Annotated, Any, Dict, Iterable, List, Optional, Union
 from abc import ABC
-from functools import cached_property
+from copy import copy
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 # to ensure that koheesio.models is a drop in replacement for pydantic
@@ -35,6 +36,35 @@ __all__ = [
 ]
 
 
+@lru_cache(maxsize=1024)
+def _normalize_description(description: str) -> str:
+    """Only use the first non-empty line of the description, limited to around 120 characters
+
+    Cached, as the same docstrings and descriptions are normalized over and over again for every instance of a Model.
+    """
+    _description = description.split("\n", maxsplit=2)
+    description = next((line for line in _description if line.strip()), "").strip()
+
+    # Limit the description to around 120 characters, cutting at the first whole word exceeding this limit
+    if len(description) > 120:
+        # Find the first space after the 115th character
+        if (space_index := description.find(" ", 115)) == -1:
+            space_index = 117  # 120 characters - 3 for the ellipsis
+
+        description = description[:space_index] + "..."
+
+    return description
+
+
+def _shallow_copy(value: Any) -> Any:
+    """Shallow copies nested models and containers, so that these are not shared between two model instances"""
+    if isinstance(value, PydanticBaseModel):
+        return value.model_copy()
+    if isinstance(value, (dict, list, set)):
+        return copy(value)
+    return value
+
+
 # pylint: disable=function-redefined
 class BaseModel(PydanticBaseModel, ABC):
     """
@@ -227,16 +257,7 @@ class BaseModel(PydanticBaseModel, ABC):
         Validates the 'name' and 'description' of the Model according to the rules outlined in the class docstring.
         """
         self.name = str(self.name or self.__class__.__name__ or "")
-        _description = (self.description or self.__doc__ or self.name).split("\n", maxsplit=2)
-        self.description = next((line for line in _description if line.strip()), "").strip()
-
-        # Limit the description to around 120 characters, cutting at the first whole word exceeding this limit
-        if len(self.description) > 120:
-            # Find the first space after the 115th character
-            if (space_index := self.description.find(" ", 115)) == -1:
-                space_index = 117  # 120 characters - 3 for the ellipsis
-
-            self.description = self.description[:space_index] + "..."
+        self.description = _normalize_description(self.description or self.__doc__ or self.name)
 
         return self
 
@@ -252,7 +273,7 @@ class BaseModel(PydanticBaseModel, ABC):
         return cls(**kwargs)
 
     @classmethod
-    def from_context(cls, context: Context) -> BaseModel:
+    def from_context(cls, context: Context, trusted: bool = False) -> BaseModel:
         """Creates BaseModel instance from a given Context
 
         You have to make sure that the Context object has the necessary attributes to create the model.
@@ -272,29 +293,41 @@ class BaseModel(PydanticBaseModel, ABC):
         Parameters
         ----------
         context: Context
+        trusted: bool, optional, default=False
+            Toggles whether to skip validation of the given context, see `from_dict`
 
         Returns
         -------
         BaseModel
         """
+        if trusted:
+            return cls.model_construct(**context)
         return cls(**context)
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> BaseModel:
+    def from_dict(cls, data: Dict[str, Any], trusted: bool = False) -> BaseModel:
         """Creates BaseModel instance from a given dictionary
 
+        When `trusted` is set to True, the model is constructed without running any validation (essentially an alias to
+        `BaseModel.model_construct()`). Only use this for data that is already known to be valid and of the right
+        types, as no coercion takes place and model validators (like setting the name and description) are skipped.
+
         Parameters
         ----------
         data: Dict[str, Any]
+        trusted: bool, optional, default=False
+            Toggles whether to skip validation of the given data
 
         Returns
         -------
         BaseModel
         """
+        if trusted:
+            return cls.model_construct(**data)
         return cls(**data)
 
     @classmethod
-    def from_json(cls, json_file_or_str: Union[str, Path]) -> BaseModel:
+    def from_json(cls, json_file_or_str: Union[str, bytes, Path]) -> BaseModel:
         """Creates BaseModel instance from a given JSON string
 
         BaseModel offloads the serialization and deserialization of the JSON string to Context class. Context uses
@@ -307,8 +340,8 @@ class BaseModel(PydanticBaseModel, ABC):
 
         Parameters
         ----------
-        json_file_or_str : Union[str, Path]
-            Pathlike string or Path that points to the json file or string containing json
+        json_file_or_str : Union[str, bytes, Path]
+            Pathlike string or Path that points to the json file or string (or bytes) containing json
 
         Returns
         -------
@@ -358,6 +391,10 @@ class BaseModel(PydanticBaseModel, ABC):
         """Constructs the model without doing validation
 
         Essentially an alias to BaseModel.construct()
+
+        Intended for staging values that only become available over time (conditionally, or inside a try-block or
+        with-statement). When all values are known up front, pass them at once instead: either to the regular
+        constructor, or to `from_dict(data, trusted=True)` to skip validation altogether.
         """
         return cls.model_construct()
 
@@ -423,6 +460,11 @@ class BaseModel(PydanticBaseModel, ABC):
         Any
             The value of the attribute
         """
+        # fields and extras are looked up directly, rather than going through the full attribute resolution
+        if name in self.__dict__:
+            return self.__dict__[name]
+        if self.__pydantic_extra__ and name in self.__pydantic_extra__:
+            return self.__pydantic_extra__[name]
         return self.__getattribute__(name)
 
     def __setitem__(self, key: str, value: Any):
@@ -543,13 +585,21 @@ class BaseModel(PydanticBaseModel, ABC):
         """
         return Context(**self.to_dict())
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, fields: Optional[Union[str, Iterable[str]]] = None) -> Dict[str, Any]:
         """Converts the BaseModel instance to a dictionary
 
+        Parameters
+        ----------
+        fields: Optional[Union[str, Iterable[str]]], optional, default=None
+            Name(s) of the fields to include. When provided, only these fields are serialized instead of the full model.
+            In case an individual field name is passed, it is treated as a list of one.
+
         Returns
         -------
         Dict[str, Any]
         """
+        if fields is not None:
+            return self.model_dump(include={fields} if isinstance(fields, str) else set(fields))
         return self.model_dump()
 
     def to_json(self, pretty: bool = False):
@@ -625,12 +675,19 @@ class BaseModel(PydanticBaseModel, ABC):
         In this example, the `foo_model` instance is created without immediate validation. The attributes foo and lorem
         are set afterward. The `validate` method is then called to validate the instance.
 
+        Note: the returned instance does not share nested models or containers (dict, list, set) with this instance;
+        these are (shallow) copied before being validated. Any other objects (e.g. a DataFrame) are passed as is.
+
         Returns
         -------
         BaseModel
             The BaseModel instance
         """
-        return self.model_validate(self.model_dump())
+        # validate the fields (and extras) as stored on the instance, no need to serialize them through model_dump first
+        # note: __dict__ can also hold cached_property values (e.g. extra_params), which should not be passed along
+        fields = {k: self.__dict__[k] for k in self.__class__.model_fields if k in self.__dict__}
+        data = {k: _shallow_copy(v) for k, v in {**fields, **(self.__pydantic_extra__ or {})}.items()}
+        return self.model_validate(data)
 
 
 # pylint: enable=function-redefined
@@ -657,16 +714,29 @@ class ExtraParamsMixin(PydanticBaseModel):
         self.params = {**self.params, **self.extra_params}
         return self
 
+    def __copy__(self):
+        """Ensures a (shallow) copy derives its own extra_params, rather than holding on to the cached ones of self"""
+        _copy = super().__copy__()
+        _copy.__dict__.pop("extra_params", None)
+        return _copy
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None):
+        """Ensures a deep copy derives its own extra_params, rather than holding on to the cached ones of self"""
+        _copy = super().__deepcopy__(memo)
+        _copy.__dict__.pop("extra_params", None)
+        return _copy
+
 
 def _list_of_columns_validation(columns_value):
     """
     Performs validation for ListOfColumns type. Will ensure that there are no duplicate columns, empty strings, etc.
     In case an individual column is passed, it will coerce it to a list.
     """
-    columns = [columns_value] if isinstance(columns_value, str) else [*columns_value]
-    columns = [col for col in columns if col]  # remove empty strings, None, etc.
+    if isinstance(columns_value, str):
+        return [columns_value] if columns_value else []
 
-    return list(dict.fromkeys(columns))  # dict.fromkeys is used to dedup while maintaining order
+    # dict.fromkeys is used to dedup while maintaining order; empty strings, None, etc. are filtered out
+    return list(dict.fromkeys([col for col in columns_value if col]))
 
 
 ListOfColumns = Annotated[Union[str, List[str]], BeforeValidator(_list_of_columns_validation)]
@@ -151,9 +151,9 @@ class Trigger(Step):
         return trigger
 
     @classmethod
-    def from_dict(cls, _dict):
+    def from_dict(cls, _dict, trusted: bool = False):
         """Creates a Trigger class based on a dictionary"""
-        return cls(**_dict)
+        return super().from_dict(_dict, trusted=trusted)
 
     @classmethod
     def from_string(cls, trigger: str):
@@ -1,30 +1,57 @@
 import json
-from typing import Optional
+from typing import Any, Optional
 from textwrap import dedent
 
 import pytest
-import yaml
 
 from koheesio.context import Context
-from koheesio.models import BaseModel, ExtraParamsMixin
+from koheesio.models import BaseModel, ExtraParamsMixin, ListOfColumns, ValidationError
 
 
-class TestBaseModel:
-    class SimpleModel(BaseModel):
-        a: int
-        b: str = "default"
+class SimpleModel(BaseModel):
+    a: int
+    b: str = "default"
+
+
+class FooModel(BaseModel):
+    foo: Optional[str] = None
+    baz: Optional[int] = None
+
+
+_CONTEXT_DATA = ({"foo": "bar"}, {"baz": 123}, {"foo": "bar", "baz": 123})
+"""Inputs for the `context_data` fixture, shared (and not to be mutated) across tests"""
+
+
+@pytest.fixture(scope="module")
+def _simple_model():
+    return SimpleModel(a=1)
+
+
+@pytest.fixture
+def simple_model(_simple_model):
+    """Copy of a SimpleModel(a=1) instance that is only validated once per module"""
+    return _simple_model.model_copy()
 
-    class FooModel(BaseModel):
-        foo: Optional[str] = None
-        baz: Optional[int] = None
 
-    def test_a_simple_model(self):
+@pytest.fixture(scope="class")
+def model_instance(request):
+    """Validated instance of a model class, created once per (model_class, instance_arg) param"""
+    model_class, instance_arg = request.param
+    return model_class(**instance_arg)
+
+
+class TestBaseModel:
+    def test_a_simple_model(self, simple_model):
         """Test a simple model."""
-        foo = self.SimpleModel(a=1)
-        assert foo.model_dump() == {"a": 1, "b": "default", "description": "SimpleModel", "name": "SimpleModel"}
+        assert simple_model.model_dump() == {
+            "a": 1,
+            "b": "default",
+            "description": "SimpleModel",
+            "name": "SimpleModel",
+        }
 
     def test_context_management_no_exception(self):
-        with self.SimpleModel.lazy() as m:
+        with SimpleModel.lazy() as m:
             m.a = 1
             m.b = "test"
         assert m.a == 1
@@ -33,7 +60,7 @@ class TestBaseModel:
     def test_context_management_with_exception(self):
         """The context manager should raise the original exception after exiting the context."""
         with pytest.raises(ValueError):
-            with self.SimpleModel.lazy() as m:
+            with SimpleModel.lazy() as m:
                 m.a = 1
                 m.b = "test"
                 raise ValueError("Test exception")
@@ -41,48 +68,124 @@ class TestBaseModel:
         assert m.a == 1
         assert m.b == "test"
 
-    @pytest.fixture(params=[{"foo": "bar"}, {"baz": 123}, {"foo": "bar", "baz": 123}])
+    def test_lazy_equivalent_to_trusted_from_dict(self):
+        with SimpleModel.lazy() as m:
+            m.a = 1
+            m.b = "test"
+
+        model = SimpleModel.from_dict({"a": 1, "b": "test"}, trusted=True)
+        assert model.model_dump() == m.model_dump()
+
+    def test_context_management_validates_on_exit(self):
+        with pytest.raises(ValidationError):
+            with SimpleModel.lazy() as m:
+                m.b = "test"
+
+        with SimpleModel.lazy() as m:
+            m.a = 1
+            m.c = "extra"
+        assert m.validate().c == "extra"
+
+    def test_validate_does_not_share_nested_values(self):
+        class Inner(BaseModel):
+            x: int
+
+        class Outer(BaseModel):
+            inner: Inner
+            blob: Any
+
+        outer = Outer.lazy()
+        outer.inner = Inner(x=1)
+        outer.blob = {"foo": "bar"}
+
+        validated = outer.validate()
+        assert validated.inner is not outer.inner
+        assert validated.blob is not outer.blob
+
+        validated.inner.x = 2
+        validated.blob["foo"] = "baz"
+        assert outer.inner.x == 1
+        assert outer.blob == {"foo": "bar"}
+
+    @pytest.fixture(params=_CONTEXT_DATA)
     def context_data(self, request):
         return request.param
 
-    def test_add(self):
-        model1 = self.SimpleModel(a=1)
-        model2 = self.SimpleModel(a=2)
-        model = model1 + model2
+    def test_add(self, simple_model):
+        model2 = SimpleModel(a=2)
+        model = simple_model + model2
         assert isinstance(model, BaseModel)
         assert model.a == 2
         assert model.b == "default"
 
-    def test_getitem(self):
-        model = self.SimpleModel(a=1)
-        assert model["a"] == 1
+    def test_getitem(self, simple_model):
+        assert simple_model["a"] == 1
 
-    def test_setitem(self):
-        model = self.SimpleModel(a=1)
-        model["a"] = 2
-        assert model.a == 2
+    def test_getitem_extra(self):
+        model = SimpleModel(a=1, c=3)
+        assert model["c"] == 3
+        assert model.get("c") == 3
+        assert model["log"] is not None  # non-field attributes are still accessible
+        with pytest.raises(AttributeError):
+            _ = model["non_existent_key"]
+
+    def test_setitem(self, simple_model):
+        simple_model["a"] = 2
+        assert simple_model.a == 2
 
-    def test_hasattr(self):
-        model = self.SimpleModel(a=1)
-        assert model.hasattr("a")
-        assert not model.hasattr("non_existent_key")
+    def test_hasattr(self, simple_model):
+        assert simple_model.hasattr("a")
+        assert not simple_model.hasattr("non_existent_key")
 
     def test_from_context(self, context_data):
         context = Context(context_data)
-        model = self.FooModel.from_context(context)
+        model = FooModel.from_context(context)
         assert isinstance(model, BaseModel)
         for key, value in context_data.items():
             assert getattr(model, key) == value
 
     def test_from_dict(self, context_data):
-        model = self.FooModel.from_dict(context_data)
+        model = FooModel.from_dict(context_data)
         assert isinstance(model, BaseModel)
         for key, value in context_data.items():
             assert getattr(model, key) == value
 
+    def test_from_dict_trusted(self, context_data):
+        model = FooModel.from_dict(context_data, trusted=True)
+        assert isinstance(model, FooModel)
+        for key, value in context_data.items():
+            assert getattr(model, key) == value
+        # no validation takes place, hence no coercion or defaults being derived
+        assert FooModel.from_dict({"baz": "123"}, trusted=True).baz == "123"
+        assert model.name is None
+
+    def test_from_context_trusted(self, context_data):
+        model = FooModel.from_context(Context(context_data), trusted=True)
+        assert isinstance(model, FooModel)
+        for key, value in context_data.items():
+            assert getattr(model, key) == value
+
+    def test_from_context_with_legacy_from_dict_override(self, context_data):
+        class LegacyModel(FooModel):
+            @classmethod
+            def from_dict(cls, _dict):
+                return cls(**_dict)
+
+        model = LegacyModel.from_context(Context(context_data))
+        assert isinstance(model, LegacyModel)
+        for key, value in context_data.items():
+            assert getattr(model, key) == value
+
     def test_from_json(self, context_data):
         json_data = json.dumps(context_data)
-        model = self.FooModel.from_json(json_data)
+        model = FooModel.from_json(json_data)
+        assert isinstance(model, BaseModel)
+        for key, value in context_data.items():
+            assert getattr(model, key) == value
+
+    def test_from_json_bytes(self, context_data):
+        json_data = json.dumps(context_data).encode("utf-8")
+        model = FooModel.from_json(json_data)
         assert isinstance(model, BaseModel)
         for key, value in context_data.items():
             assert getattr(model, key) == value
@@ -94,42 +197,43 @@ class TestBaseModel:
             b = "default"
             """
         )
-        model = self.SimpleModel.from_toml(toml_data)
+        model = SimpleModel.from_toml(toml_data)
         assert isinstance(model, BaseModel)
         assert model.a == 1
         assert model.b == "default"
 
     def test_from_yaml(self, context_data):
-        yaml_data = yaml.dump(context_data)
-        model = self.FooModel.from_yaml(yaml_data)
+        yaml_data = Context(context_data).to_yaml()
+        model = FooModel.from_yaml(yaml_data)
         assert isinstance(model, BaseModel)
         for key, value in context_data.items():
             assert getattr(model, key) == value
 
-    def test_to_context(self):
-        model = self.SimpleModel(a=1)
-        context = model.to_context()
+    def test_to_context(self, simple_model):
+        context = simple_model.to_context()
         assert isinstance(context, Context)
         assert context.a == 1
         assert context.b == "default"
 
-    def test_to_dict(self):
-        model = self.SimpleModel(a=1)
-        dict_model = model.to_dict()
+    def test_to_dict(self, simple_model):
+        dict_model = simple_model.to_dict()
         assert isinstance(dict_model, dict)
         assert dict_model["a"] == 1
         assert dict_model["b"] == "default"
 
-    def test_to_json(self):
-        model = self.SimpleModel(a=1)
-        json_model = model.to_json()
+    def test_to_dict_fields(self, simple_model):
+        assert simple_model.to_dict(fields=["a"]) == {"a": 1}
+        assert simple_model.to_dict(fields=("a", "b")) == {"a": 1, "b": "default"}
+        assert simple_model.to_dict(fields="name") == {"name": "SimpleModel"}
+
+    def test_to_json(self, simple_model):
+        json_model = simple_model.to_json()
         assert isinstance(json_model, str)
         assert '"a": 1' in json_model
         assert '"b": "default"' in json_model
 
-    def test_to_yaml(self):
-        model = self.SimpleModel(a=1)
-        yaml_model = model.to_yaml()
+    def test_to_yaml(self, simple_model):
+        yaml_model = simple_model.to_yaml()
         assert isinstance(yaml_model, str)
         assert "a: 1" in yaml_model
         assert "b: default" in yaml_model
@@ -164,34 +268,37 @@ class TestBaseModel:
         description: str = "This is a description"
 
     @pytest.mark.parametrize(
-        "model_class, instance_arg, expected",
+        "model_instance, expected",
         [
-            (ModelWithDescription, {"a": 1}, {"a": 1, "description": "This is a", "name": "ModelWithDescription"}),
+            ((ModelWithDescription, {"a": 1}), {"a": 1, "description": "This is a", "name": "ModelWithDescription"}),
             (
-                ModelWithDocstring,
-                {"a": 2},
+                (ModelWithDocstring, {"a": 2}),
                 {"a": 2, "description": "Docstring should be used as description", "name": "ModelWithDocstring"},
             ),
             (
-                EmptyLinesShouldBeRemoved,
-                {"a": 3},
+                (EmptyLinesShouldBeRemoved, {"a": 3}),
                 {"a": 3, "description": "Ignore the empty line", "name": "EmptyLinesShouldBeRemoved"},
             ),
             (
-                ModelWithNoDescription,
-                {"a": 4},
+                (ModelWithNoDescription, {"a": 4}),
                 {"a": 4, "name": "ModelWithNoDescription", "description": "ModelWithNoDescription"},
             ),
             (
-                IgnoreDocstringIfDescriptionIsProvided,
-                {"a": 5},
+                (IgnoreDocstringIfDescriptionIsProvided, {"a": 5}),
                 {"a": 5, "description": "This is a description", "name": "IgnoreDocstringIfDescriptionIsProvided"},
             ),
         ],
+        ids=[
+            "ModelWithDescription",
+            "ModelWithDocstring",
+            "EmptyLinesShouldBeRemoved",
+            "ModelWithNoDescription",
+            "IgnoreDocstringIfDescriptionIsProvided",
+        ],
+        indirect=["model_instance"],
     )
-    def test_name_and_multiline_description(self, model_class, instance_arg, expected):
-        instance = model_class(**instance_arg)
-        assert instance.model_dump() == expected
+    def test_name_and_multiline_description(self, model_instance, expected):
+        assert model_instance.model_dump() == expected
 
     class ModelWithLongDescription(BaseModel):
         a: int = "42"
@@ -214,6 +321,14 @@ class TestBaseModel:
         assert model.description == expected_description
         assert model.description.endswith("...")
 
+    def test_empty_description_falls_back_to_docstring(self):
+        class ModelWithEmptyDescription(BaseModel):
+            """Doc line"""
+
+            description: str = ""
+
+        assert ModelWithEmptyDescription().description == "Doc line"
+
 
 class TestExtraParamsMixin:
     def test_extra_params_mixin(self):
@@ -231,3 +346,47 @@ class TestExtraParamsMixin:
             "params": {"c": 3},
             "name": "SimpleModelWithExtraParams",
         }
+
+    def test_extra_params_after_validate(self):
+        class SimpleModelWithExtraParams(BaseModel, ExtraParamsMixin):
+            a: int
+
+        bar = SimpleModelWithExtraParams(a=1, c=3)
+        assert bar.extra_params == {"c": 3}
+
+        validated = bar.validate()
+        assert validated.extra_params == {"c": 3}
+        assert validated.params == {"c": 3}
+        assert "extra_params" not in validated.model_dump()
+
+    @pytest.mark.parametrize("deep", [False, True])
+    def test_extra_params_after_copy(self, deep):
+        class SimpleModelWithExtraParams(BaseModel, ExtraParamsMixin):
+            a: int
+
+        bar = SimpleModelWithExtraParams(a=1, c=3)
+        assert bar.extra_params == {"c": 3}
+
+        bar_copy = bar.model_copy(update={"c": 4}, deep=deep)
+        assert bar_copy.extra_params == {"c": 4}
+        assert bar.extra_params == {"c": 3}
+
+
+class TestAnnotatedTypes:
+    class SomeModelWithListOfColumns(BaseModel):
+        a: ListOfColumns
+
+    @pytest.mark.parametrize(
+        "columns, expected",
+        [
+            ("foo", ["foo"]),
+            ("", []),
+            (["foo", "bar"], ["foo", "bar"]),
+            (["foo", None, "", "bar"], ["foo", "bar"]),
+            (["foo", "bar", "foo"], ["foo", "bar"]),
+            (("foo", "bar"), ["foo", "bar"]),
+        ],
+    )
+    def test_list_of_columns(self, columns, expected):
+        model = self.SomeModelWithListOfColumns(a=columns)
+        assert model.a == expected